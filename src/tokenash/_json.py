@@ -0,0 +1,38 @@
+"""JSON serialization helpers, backed by orjson when available.
+
+orjson encodes/decodes several times faster than stdlib json and works
+directly in bytes. It is an optional dependency (the ``perf`` extra);
+source-only installs fall back to stdlib json transparently.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+
+    def dumps_compact(obj: Any) -> str:
+        """Serialize to a compact JSON string (no whitespace)."""
+        return orjson.dumps(obj).decode("utf-8")
+
+    def dumps_pretty(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes for on-disk storage."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def loads(data: bytes | str) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return orjson.loads(data)
+
+except ImportError:
+    import json
+
+    def dumps_compact(obj: Any) -> str:
+        """Serialize to a compact JSON string (no whitespace)."""
+        return json.dumps(obj, separators=(",", ":"))
+
+    def dumps_pretty(obj: Any) -> bytes:
+        """Serialize to indented JSON bytes for on-disk storage."""
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    def loads(data: bytes | str) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return json.loads(data)
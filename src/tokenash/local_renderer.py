@@ -0,0 +1,71 @@
+"""Local chart rendering with matplotlib's Agg backend.
+
+Renders the usage chart to a PNG on disk without the QuickChart.io
+round-trip — useful in CI where the network call is the slowest part of
+a run. matplotlib is optional (the ``local`` extra) and is imported
+lazily so markdown-only users don't need it.
+"""
+
+from pathlib import Path
+
+from tokenash.models import DailyUsage
+
+# Same palette as the QuickChart config, as matplotlib RGBA tuples.
+_PROVIDER_COLORS = {
+    "openai": (16 / 255, 163 / 255, 127 / 255, 0.7),
+    "anthropic": (204 / 255, 131 / 255, 75 / 255, 0.7),
+}
+_DEFAULT_COLOR = (100 / 255, 100 / 255, 100 / 255, 0.7)
+
+
+def render(
+    usage_data: list[DailyUsage],
+    out_path: Path,
+    width: int = 800,
+    height: int = 400,
+    title: str = "",
+) -> Path:
+    """Render the usage chart as a PNG at out_path."""
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError as e:
+        raise ImportError(
+            "renderer='local' requires matplotlib; install tokenash[local]"
+        ) from e
+
+    labels = [d.date[5:7] + "/" + d.date[8:10] for d in usage_data]
+    providers = sorted({p for d in usage_data for p in d.providers})
+
+    fig, ax = plt.subplots(figsize=(width / 100, height / 100), dpi=100)
+    try:
+        if providers:
+            # Stacked bars, one segment per provider per day.
+            bottom = [0] * len(usage_data)
+            for provider in providers:
+                column = [d.providers.get(provider, 0) for d in usage_data]
+                ax.bar(
+                    labels,
+                    column,
+                    bottom=bottom,
+                    label=provider.capitalize(),
+                    color=_PROVIDER_COLORS.get(provider, _DEFAULT_COLOR),
+                )
+                bottom = [b + c for b, c in zip(bottom, column)]
+            if len(providers) > 1:
+                ax.legend(loc="upper center", bbox_to_anchor=(0.5, -0.15), ncol=len(providers))
+        else:
+            ax.plot(labels, [d.total for d in usage_data], color=(1, 99 / 255, 132 / 255))
+
+        if title:
+            ax.set_title(title)
+        ax.set_ylabel("Tokens")
+        ax.tick_params(axis="x", labelrotation=45)
+
+        fig.savefig(out_path, format="png", bbox_inches="tight")
+    finally:
+        plt.close(fig)
+
+    return out_path
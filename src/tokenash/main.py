@@ -1,5 +1,6 @@
 """TokenAsh - Track your AI token usage."""
 
+import asyncio
 import os
 from datetime import date, timedelta
 from pathlib import Path
@@ -52,60 +53,72 @@ def fetch_today_usage(providers: list) -> DailyUsage:
         try:
             daily_data = provider.get_daily_usage(today, today)
             if daily_data:
-                usage.providers[provider.name] = daily_data[0].total_tokens
+                usage.set_provider(provider.name, daily_data[0].total_tokens)
         except Exception as e:
             print(f"Error fetching {provider.name} usage: {e}")
 
     return usage
 
 
+async def _gather_usage(providers: list, start_date: date, end_date: date) -> list[list]:
+    """Fetch all providers' usage concurrently, one result list each."""
+
+    async def fetch(provider) -> list:
+        try:
+            return await provider.get_daily_usage_async(start_date, end_date)
+        except Exception as e:
+            print(f"Error fetching {provider.name} historical usage: {e}")
+            return []
+
+    return await asyncio.gather(*(fetch(p) for p in providers))
+
+
 def fetch_historical_usage(providers: list, days: int = 30) -> list[DailyUsage]:
-    """Fetch historical usage for the last N days."""
+    """Fetch historical usage for the last N days.
+
+    Providers are queried concurrently, so wall time is bounded by the
+    slowest provider rather than the sum of all of them.
+    """
     end_date = date.today()
     start_date = end_date - timedelta(days=days)
-    usage_list = []
 
-    for provider in providers:
-        if not provider.is_configured():
-            continue
+    providers = [p for p in providers if p.is_configured()]
+    results = asyncio.run(_gather_usage(providers, start_date, end_date))
 
-        try:
-            data = provider.get_daily_usage(start_date, end_date)
-            for d in data:
-                existing = next((u for u in usage_list if u.date == d.date), None)
-                if existing:
-                    existing.providers[provider.name] = d.total_tokens
-                else:
-                    new_usage = DailyUsage(date=d.date)
-                    new_usage.providers[provider.name] = d.total_tokens
-                    usage_list.append(new_usage)
-        except Exception as e:
-            print(f"Error fetching {provider.name} historical usage: {e}")
+    by_date: dict[str, DailyUsage] = {}
+    for provider, data in zip(providers, results):
+        for d in data:
+            bucket = by_date.get(d.date)
+            if bucket is None:
+                bucket = DailyUsage(date=d.date)
+                by_date[d.date] = bucket
+            bucket.set_provider(provider.name, d.total_tokens)
 
-    usage_list.sort(key=lambda x: x.date)
-    return usage_list
+    return sorted(by_date.values(), key=lambda x: x.date)
 
 
 def update_readme(markdown: str, readme_path: str, start_marker: str, end_marker: str) -> bool:
     """Update README with new chart markdown."""
-    if not Path(readme_path).exists():
+    path = Path(readme_path)
+    if not path.exists():
         print(f"README not found at {readme_path}")
         return False
 
-    content = Path(readme_path).read_text()
+    content = path.read_text(encoding="utf-8")
+
+    # partition() locates each marker and splits in a single scan,
+    # replacing the separate `in` checks and find() calls.
+    prefix, found_start, rest = content.partition(start_marker)
+    _, found_end, suffix = rest.partition(end_marker)
 
-    if start_marker not in content or end_marker not in content:
+    if not found_start or not found_end:
         print("Markers not found in README")
         return False
 
-    start_idx = content.find(start_marker)
-    end_idx = content.find(end_marker) + len(end_marker)
-
-    new_content = (
-        content[:start_idx] + start_marker + "\n" + markdown + "\n" + end_marker + content[end_idx:]
+    path.write_text(
+        prefix + start_marker + "\n" + markdown + "\n" + end_marker + suffix,
+        encoding="utf-8",
     )
-
-    Path(readme_path).write_text(new_content)
     return True
 
 
@@ -134,6 +147,7 @@ def run(config_path: str = "config.yaml", output_dir: str = "data", charts_dir:
     chart = ChartGenerator(
         title=chart_config.get("title", "🔥 Token Consumption (Last 30 Days)"),
         output_dir=charts_dir,
+        renderer=chart_config.get("renderer", "quickchart"),
     )
 
     recent_data = history.get_last_n_days(chart_config.get("days", 30))
@@ -1,21 +1,36 @@
 """Token usage data models."""
 
+import bisect
 from dataclasses import dataclass, field
 from datetime import date
 from typing import Any
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-@dataclass
+
+@dataclass(slots=True)
 class DailyUsage:
     """Single day's token usage across all providers."""
 
     date: str  # YYYY-MM-DD format
     providers: dict[str, int] = field(default_factory=dict)  # provider_name -> token_count
+    _total: int | None = field(default=None, repr=False, compare=False)
 
     @property
     def total(self) -> int:
-        """Total tokens across all providers."""
-        return sum(self.providers.values())
+        """Total tokens across all providers (cached between mutations)."""
+        if self._total is None:
+            self._total = sum(self.providers.values())
+        return self._total
+
+    def set_provider(self, name: str, count: int) -> None:
+        """Set a provider's token count, keeping the cached total in sync."""
+        if self._total is not None:
+            self._total += count - self.providers.get(name, 0)
+        self.providers[name] = count
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -31,33 +46,44 @@ class DailyUsage:
         return cls(date=data["date"], providers=data.get("providers", {}))
 
 
-@dataclass
+@dataclass(slots=True)
 class UsageHistory:
-    """Historical token usage data."""
+    """Historical token usage data. Records are kept sorted by date."""
 
     records: list[DailyUsage] = field(default_factory=list)
+    # Dates parallel to records (same order), so lookups bisect a plain
+    # string list instead of probing records with a key function.
+    _dates: list[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._dates = [r.date for r in self.records]
 
     def add_or_update(self, daily_usage: DailyUsage) -> None:
-        """Add or update a day's usage record."""
-        for i, record in enumerate(self.records):
-            if record.date == daily_usage.date:
-                # Update existing record
-                for provider, count in daily_usage.providers.items():
-                    record.providers[provider] = count
-                return
-        # Add new record
-        self.records.append(daily_usage)
-        # Keep sorted by date
-        self.records.sort(key=lambda x: x.date)
+        """Add or update a day's usage record in O(log N)."""
+        pos = bisect.bisect_left(self._dates, daily_usage.date)
+        if pos < len(self._dates) and self._dates[pos] == daily_usage.date:
+            # Update existing record
+            record = self.records[pos]
+            for provider, count in daily_usage.providers.items():
+                record.set_provider(provider, count)
+            return
+        # Insert new record at its sorted position
+        self._dates.insert(pos, daily_usage.date)
+        self.records.insert(pos, daily_usage)
 
     def get_last_n_days(self, n: int) -> list[DailyUsage]:
-        """Get the last n days of usage records."""
+        """Get the last n days of usage records (records stay sorted)."""
         return self.records[-n:] if len(self.records) > n else self.records
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
+        # Emit record dicts inline in one comprehension; totals come
+        # from the cached field instead of a re-sum per record.
         return {
-            "records": [r.to_dict() for r in self.records],
+            "records": [
+                {"date": r.date, "providers": r.providers, "total": r.total}
+                for r in self.records
+            ],
         }
 
     @classmethod
@@ -65,3 +91,90 @@ class UsageHistory:
         """Create from dictionary."""
         records = [DailyUsage.from_dict(r) for r in data.get("records", [])]
         return cls(records=records)
+
+
+class UsageHistoryArray:
+    """Columnar (structure-of-arrays) view of a usage history.
+
+    Stores one contiguous int64 column per provider plus an int64 array
+    of day ordinals, so scans and totals over multi-year histories run
+    as vectorized NumPy ops on ~16 bytes/day instead of walking one
+    heap-allocated DailyUsage per record. Requires NumPy (the ``perf``
+    extra); UsageHistory stays the default representation and the
+    on-disk JSON schema is shared between the two.
+
+    Days a provider has no data for are stored as 0 in its column.
+    """
+
+    def __init__(self) -> None:
+        if np is None:
+            raise ImportError("UsageHistoryArray requires numpy; install tokenash[perf]")
+        self.dates = np.empty(0, dtype=np.int64)  # proleptic day ordinals, sorted
+        self.columns: dict[str, Any] = {}  # provider -> int64 column
+
+    @staticmethod
+    def _day_number(date_str: str) -> int:
+        return date.fromisoformat(date_str).toordinal()
+
+    @staticmethod
+    def _day_string(day: int) -> str:
+        return date.fromordinal(int(day)).isoformat()
+
+    def add_or_update(self, daily_usage: DailyUsage) -> None:
+        """Add or update a day's usage record."""
+        day = self._day_number(daily_usage.date)
+        pos = int(np.searchsorted(self.dates, day))
+        if pos == self.dates.size or self.dates[pos] != day:
+            self.dates = np.insert(self.dates, pos, day)
+            for name, column in self.columns.items():
+                self.columns[name] = np.insert(column, pos, 0)
+        for name, count in daily_usage.providers.items():
+            column = self.columns.get(name)
+            if column is None:
+                column = self.columns[name] = np.zeros(self.dates.size, dtype=np.int64)
+            column[pos] = count
+
+    def totals(self) -> Any:
+        """Per-day totals across all providers as an int64 array."""
+        if not self.columns:
+            return np.zeros(self.dates.size, dtype=np.int64)
+        return sum(self.columns.values())
+
+    def _row(self, i: int) -> DailyUsage:
+        providers = {
+            name: int(column[i]) for name, column in self.columns.items() if column[i]
+        }
+        return DailyUsage(date=self._day_string(self.dates[i]), providers=providers)
+
+    def get_last_n_days(self, n: int) -> list[DailyUsage]:
+        """Get the last n days of usage as DailyUsage records."""
+        start = max(self.dates.size - n, 0)
+        return [self._row(i) for i in range(start, self.dates.size)]
+
+    @classmethod
+    def from_history(cls, history: UsageHistory) -> "UsageHistoryArray":
+        """Build columns from a row-oriented history in one bulk pass."""
+        array = cls()
+        records = history.records
+        n = len(records)
+        array.dates = np.fromiter(
+            (cls._day_number(r.date) for r in records), dtype=np.int64, count=n
+        )
+        for name in sorted({p for r in records for p in r.providers}):
+            array.columns[name] = np.fromiter(
+                (r.providers.get(name, 0) for r in records), dtype=np.int64, count=n
+            )
+        return array
+
+    def to_history(self) -> UsageHistory:
+        """Convert back to the row-oriented representation."""
+        return UsageHistory(records=[self._row(i) for i in range(self.dates.size)])
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the same dictionary schema as UsageHistory."""
+        return self.to_history().to_dict()
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "UsageHistoryArray":
+        """Create from a UsageHistory-schema dictionary."""
+        return cls.from_history(UsageHistory.from_dict(data))
@@ -18,19 +18,19 @@ class AnthropicProvider(Provider):
     def __init__(self, api_key: str | None = None):
         super().__init__(api_key)
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
+        self._session.headers.update(
+            {
+                "x-api-key": self.api_key or "",
+                "anthropic-version": "2023-06-01",
+            }
+        )
 
     def is_configured(self) -> bool:
         return bool(self.api_key)
 
     def _make_request(self, endpoint: str, params: dict[str, Any] | None = None) -> dict:
         """Make authenticated request to Anthropic API."""
-        headers = {
-            "x-api-key": self.api_key,
-            "anthropic-version": "2023-06-01",
-        }
-        response = requests.get(
-            f"{self.BASE_URL}{endpoint}", headers=headers, params=params, timeout=30
-        )
+        response = self._session.get(f"{self.BASE_URL}{endpoint}", params=params, timeout=30)
         response.raise_for_status()
         return response.json()
 
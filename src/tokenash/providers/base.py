@@ -1,13 +1,44 @@
 """Base provider interface for token usage APIs."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import date
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-@dataclass
+
+def build_session(headers: dict[str, str] | None = None) -> requests.Session:
+    """
+    Create a Session with connection pooling and retries.
+
+    Reusing a single Session keeps the HTTPS connection warm across
+    calls instead of paying a TCP+TLS handshake per request, and the
+    retry policy absorbs transient errors and rate limits.
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@dataclass(frozen=True, slots=True)
 class UsageData:
-    """Token usage data from a provider."""
+    """Token usage data from a provider. Immutable once fetched."""
 
     date: str  # YYYY-MM-DD
     input_tokens: int
@@ -23,6 +54,7 @@ class Provider(ABC):
     def __init__(self, api_key: str | None = None):
         """Initialize provider with optional API key."""
         self.api_key = api_key
+        self._session = build_session()
 
     @abstractmethod
     def get_daily_usage(self, start_date: date, end_date: date) -> list[UsageData]:
@@ -38,6 +70,17 @@ class Provider(ABC):
         """
         pass
 
+    async def get_daily_usage_async(self, start_date: date, end_date: date) -> list[UsageData]:
+        """
+        Async variant of get_daily_usage.
+
+        The default runs the sync implementation in a worker thread, so
+        providers without a native async path still overlap with each
+        other under asyncio.gather. Providers can override this with a
+        genuinely async implementation (see OpenAIProvider).
+        """
+        return await asyncio.to_thread(self.get_daily_usage, start_date, end_date)
+
     @abstractmethod
     def is_configured(self) -> bool:
         """Check if the provider is properly configured."""
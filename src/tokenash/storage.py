@@ -1,9 +1,9 @@
 """Token usage data storage."""
 
-import json
+import os
 from pathlib import Path
-from typing import Any
 
+from tokenash._json import dumps_pretty, loads
 from tokenash.models import UsageHistory
 
 
@@ -22,17 +22,22 @@ class Storage:
             return UsageHistory()
 
         try:
-            with open(self.usage_file) as f:
-                data = json.load(f)
+            data = loads(self.usage_file.read_bytes())
             return UsageHistory.from_dict(data)
-        except (json.JSONDecodeError, KeyError):
+        except (ValueError, KeyError):
             # Corrupted file, start fresh
             return UsageHistory()
 
     def save_usage_history(self, history: UsageHistory) -> None:
-        """Save usage history to file."""
-        with open(self.usage_file, "w") as f:
-            json.dump(history.to_dict(), f, indent=2)
+        """Save usage history to file.
+
+        The data is written to a temp file and renamed into place, so a
+        crash mid-write can never leave usage.json truncated (which
+        load_usage_history would silently treat as an empty history).
+        """
+        tmp = self.usage_file.with_suffix(".json.tmp")
+        tmp.write_bytes(dumps_pretty(history.to_dict()))
+        os.replace(tmp, self.usage_file)
 
     def load_chart_template(self) -> str | None:
         """Load custom chart template if exists."""